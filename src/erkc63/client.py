@@ -403,7 +403,7 @@ class ErkcClient:
         self,
         accrual: Accrual,
         *,
-        max_xy: tuple[int, int] = (3840, 2160),
+        max_xy: tuple[int, int] = (1920, 1080),
     ) -> AccrualData | None:
         """
         Загружает счет на оплату в формате PDF. Преобразует его и извлекает QR-коды
@@ -414,7 +414,7 @@ class ErkcClient:
 
         Parameters:
             accrual: объект начисления.
-            max_xy: ограничение разрешения файлов PNG в пикселях (по-умолчанию: 3840x2160).
+            max_xy: ограничение разрешения файлов PNG в пикселях (по-умолчанию: 1920x1080).
         """
 
         if not QRCODE_SUPPORT:
@@ -429,7 +429,7 @@ class ErkcClient:
         self,
         accrual: Accrual,
         *,
-        max_xy: tuple[int, int] = (3840, 2160),
+        max_xy: tuple[int, int] = (1920, 1080),
     ) -> AccrualData | None:
         """
         Загружает счет на оплату пени в формате PDF. Преобразует его и извлекает QR-коды
@@ -439,7 +439,7 @@ class ErkcClient:
 
         Parameters:
             accrual: объект начисления.
-            max_xy: ограничение разрешения файлов PNG в пикселях (по-умолчанию: 3840x2160).
+            max_xy: ограничение разрешения файлов PNG в пикселях (по-умолчанию: 1920x1080).
         """
 
         if not QRCODE_SUPPORT:
@@ -2,12 +2,16 @@
 # SPDX-FileCopyrightText: 2025-2026 Sergey Dudanov <sergey.dudanov@gmail.com>
 
 import dataclasses as dc
-from typing import Any, Self
+from operator import itemgetter
+from typing import Any, Final, Self
 
 from mashumaro import field_options
 
 from .base import DecimalString, IntNullable, ModelBase, NormalizedString
-from .parser import parse_html_divclass
+from .parser import parse_html_divclass, stripped_strings
+
+# Индексы блоков `text-col-*` главной страницы в порядке полей `AccountInfo`
+_ACCOUNT_COLS: Final = itemgetter(5, 0, 14, 16, 18, 20, 22, 1, 2, 3, 7, 9, 11, 13)
 
 
 @dc.dataclass(slots=True)
@@ -70,10 +74,5 @@ class AccountInfo(ModelBase):
     def from_html(cls, html: str) -> Self:
         """Конструктор из HTML главной страницы лицевого счета."""
 
-        tags = parse_html_divclass(html, "text-col-")
-        args = (
-            next(tags[x].stripped_strings)
-            for x in [5, 0, 14, 16, 18, 20, 22, 1, 2, 3, 7, 9, 11, 13]
-        )
-
-        return cls.from_args(*args)
+        tags = _ACCOUNT_COLS(parse_html_divclass(html, "text-col-"))
+        return cls.from_args(*(stripped_strings(x)[0] for x in tags))
@@ -6,15 +6,17 @@ import datetime as dt
 import itertools as it
 import logging
 from decimal import Decimal
-from typing import Iterator, Mapping, Self, cast
+from typing import Final, Iterator, Mapping, Self
 
-from bs4 import Tag
+from lxml.etree import XPath
 
 from .base import DateString, DecimalString, ModelBase, Serial
-from .parser import parse_html_divclass
+from .parser import parse_html_divclass, stripped_strings
 
 _LOGGER = logging.getLogger(__name__)
 
+_XP_ROWID: Final = XPath('string(.//input[starts-with(@name, "rowId")]/@value)')
+
 
 @dc.dataclass(slots=True)
 class MeterInfo(ModelBase):
@@ -35,13 +37,13 @@ class MeterInfo(ModelBase):
 
         def _items():
             for meter in parse_html_divclass(html, "block-sch"):
-                if len(data := tuple(meter.stripped_strings)) != 4:
+                if len(data := tuple(stripped_strings(meter))) != 4:
                     _LOGGER.debug("Wrong meter data: %s", data)
                     continue
 
                 _LOGGER.debug("Parsing meter data: %s", data)
 
-                id = int(cast(str, cast(Tag, meter("input")[1])["value"]))
+                id = int(_XP_ROWID(meter))
 
                 yield id, cls.from_args(*data)
 
@@ -1,39 +1,41 @@
 # SPDX-License-Identifier: Apache-2.0
 # SPDX-FileCopyrightText: 2025-2026 Sergey Dudanov <sergey.dudanov@gmail.com>
 
-import importlib.util
 from typing import Final, cast
 
-from bs4 import BeautifulSoup, Tag
-from bs4.filter import SoupStrainer
+import lxml.html
+from lxml.etree import XPath
+from lxml.html import HtmlElement
 
-HTML_PARSER: Final = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+# Выражения XPath компилируются однократно при импорте модуля
+_XP_STRINGS: Final = XPath(".//text()")
+# Вложенные совпадения не возвращаются, они остаются внутри внешнего элемента
+_DIVCLASS_PREFIX: Final = (
+    'div[contains(concat(" ", normalize-space(@class)), concat(" ", $prefix))]'
+)
+_XP_DIVCLASS: Final = XPath(f"//{_DIVCLASS_PREFIX}[not(ancestor::{_DIVCLASS_PREFIX})]")
+_XP_TOKEN: Final = XPath('//meta[@name="csrf-token"]/@content')
 
 
-def _parse_tags(html: str, ss: SoupStrainer) -> list[Tag]:
-    soup = BeautifulSoup(html, HTML_PARSER, parse_only=ss)
-    return cast(list[Tag], soup.contents)
+def stripped_strings(element: HtmlElement) -> list[str]:
+    """Возвращает непустые строки текста элемента без пробельных символов по краям"""
 
+    return [s for x in cast(list[str], _XP_STRINGS(element)) if (s := x.strip())]
 
-def parse_html_divclass(html: str, cls_prefix: str) -> list[Tag]:
-    """Возвращает список тегов `div`, имеющих класс с указанным префиксом"""
 
-    ss = SoupStrainer(
-        name="div",
-        class_=lambda x: (
-            x is not None and any(x.startswith(cls_prefix) for x in x.split())
-        ),
-    )
+def parse_html_divclass(html: str, cls_prefix: str) -> list[HtmlElement]:
+    """Возвращает список тегов `div`, имеющих класс с указанным префиксом"""
 
-    return _parse_tags(html, ss)
+    doc = lxml.html.fromstring(html)
+    return cast(list[HtmlElement], _XP_DIVCLASS(doc, prefix=cls_prefix))
 
 
 def parse_accounts(html: str) -> tuple[int, ...]:
     """Возвращает список лицевых счетов из HTML страницы."""
 
     menu = parse_html_divclass(html, "dropdown-menu")[0]
-    accounts = cast(list[Tag], menu("a")[:-2])  # нижние 2 ссылки не аккаунты
-    accounts = [int(cast(str, x.string)) for x in accounts]
+    accounts = list(menu.iter("a"))[:-2]  # нижние 2 ссылки не аккаунты
+    accounts = [int(x.text_content()) for x in accounts]
 
     # сортировка вторичных счетов
     if len(accounts) > 2:
@@ -45,5 +47,5 @@ def parse_accounts(html: str) -> tuple[int, ...]:
 def parse_token(html: str) -> str:
     """Извлекает CSRF-токен сессии из страницы"""
 
-    ss = SoupStrainer("meta", {"name": "csrf-token"})
-    return str(_parse_tags(html, ss)[0]["content"])
+    doc = lxml.html.fromstring(html)
+    return str(cast(list[str], _XP_TOKEN(doc))[0])
@@ -3,45 +3,88 @@
 
 import dataclasses as dc
 import io
-from typing import Self
+from typing import Final, Mapping, Self
 
 import pymupdf
-from PIL import Image
+from PIL import Image, features
 
+try:
+    import oxipng
 
-# Сохраняет Pixmap в 8-битный оптимизированный PNG в палитре WEB
-def _png(pix: pymupdf.Pixmap) -> bytes:
-    bio = io.BytesIO()
+    # Дополнительная оптимизация PNG QR-кодов при установленной опции `oxipng`
+    def _optimize(data: bytes) -> bytes:
+        return oxipng.optimize_from_memory(data, level=2)
+
+except ImportError:
+
+    def _optimize(data: bytes) -> bytes:
+        return data
+
+
+# Метод квантования: libimagequant, если Pillow собран с ним, иначе быстрый octree
+_QUANTIZE: Final = (
+    Image.Quantize.LIBIMAGEQUANT
+    if features.check_feature("libimagequant")
+    else Image.Quantize.FASTOCTREE
+)
+
+
+# Преобразует Pixmap в изображение с адаптивной палитрой не более `colors` цветов.
+# Оттенки серого квантовать не требуется: для них сразу возвращаются данные PNG MuPDF.
+def _image(pix: pymupdf.Pixmap, colors: int = 256) -> Image.Image | bytes:
+    if pix.alpha:
+        pix = pymupdf.Pixmap(pix, 0)
+
+    if pix.n not in (1, 3):
+        pix = pymupdf.Pixmap(pymupdf.csRGB, pix)
+
+    # Изображение создается поверх буфера Pixmap, без промежуточной копии `samples`
+    mode = "L" if pix.n == 1 else "RGB"
+    size = pix.width, pix.height
+    img = Image.frombuffer(mode, size, pix.samples_mv, "raw", mode, pix.stride, 1)
+
+    if mode == "RGB":
+        return img.quantize(colors, _QUANTIZE, dither=Image.Dither.NONE)
 
-    img = pix.pil_image()
-    img = img.convert(mode="P", palette=Image.Palette.WEB)
-    img.save(bio, format="png", optimize=True)
+    # Черно-белое изображение (обычно QR-код) сохраняем в 1-битный PNG
+    if (c := img.getcolors(2)) and {x for _, x in c} <= {0, 255}:
+        return img.convert("1", dither=Image.Dither.NONE)
+
+    return pix.tobytes("png")
+
+
+# Сохраняет изображение в PNG.
+# Уровень сжатия 1 заметно быстрее уровня по-умолчанию при небольшом росте размера.
+def _png(img: Image.Image | bytes, compress_level: int = 1) -> bytes:
+    if isinstance(img, bytes):
+        return img
+
+    bio = io.BytesIO()
+    img.save(bio, format="png", compress_level=compress_level, optimize=False)
 
     return bio.getvalue()
 
 
-# Рендерит страницу в данные PNG вписывающегося в указанное разрешение
-def _page(page: pymupdf.Page, xy: tuple[int, int]) -> bytes:
+# Рендерит страницу в изображение, вписывающееся в указанное разрешение
+def _page(page: pymupdf.Page, xy: tuple[int, int]) -> Image.Image | bytes:
     width, height = page.rect.width, page.rect.height
     scale = min(xy[0] / width, xy[1] / height)
     pix = page.get_pixmap(matrix=pymupdf.Matrix(scale, scale))
 
-    return _png(pix)
+    return _image(pix)
 
 
-# Извлекает изображение со страницы в данные PNG
-def _img(page: pymupdf.Page, img: str) -> bytes:
-    for item in page.get_images():
-        xref, name = item[0], item[7]
+# Извлекает изображение документа по имени из словаря `имя - xref`
+def _img(
+    doc: pymupdf.Document, xrefs: Mapping[str, int], img: str
+) -> Image.Image | bytes:
+    if (xref := xrefs.get(img)) is None:
+        raise FileNotFoundError("Изображение на странице не найдено.")
 
-        if name != img:
-            continue
+    pix = pymupdf.Pixmap(doc, xref)
 
-        pix = pymupdf.Pixmap(page.parent, xref)
-
-        return _png(pix)
-
-    raise FileNotFoundError("Изображение на странице не найдено.")
+    # QR-коду достаточно нескольких цветов, PNG получится 4-битным
+    return _image(pix, 16)
 
 
 @dc.dataclass(slots=True, frozen=True)
@@ -66,11 +109,14 @@ class AccrualData:
                 # Заполнен только в начале. Обрежем пополам.
                 page.set_cropbox(pymupdf.Rect(0, 0, width, height / 2))
 
-            return cls(
-                source=pdf,
-                page=_page(page, xy),
-                qr_codes=tuple(map(lambda x: _img(page, x), images)),
-            )
+            xrefs = {x[7]: x[0] for x in page.get_images()}
+            page_img = _page(page, xy)
+            qr_imgs = [_img(doc, xrefs, x) for x in images]
+
+        # Оптимизируются только небольшие QR-коды, страница кодируется быстро
+        qr_codes = tuple(_optimize(_png(x)) for x in qr_imgs)
+
+        return cls(source=pdf, page=_png(page_img), qr_codes=qr_codes)
 
     @classmethod
     def from_payment_data(cls, pdf: bytes, xy: tuple[int, int]) -> Self:
@@ -0,0 +1,127 @@
+# SPDX-License-Identifier: Apache-2.0
+# SPDX-FileCopyrightText: 2025-2026 Sergey Dudanov <sergey.dudanov@gmail.com>
+
+import datetime as dt
+import unittest
+from decimal import Decimal
+
+from erkc63.parsers.account import AccountInfo
+from erkc63.parsers.meter import MeterInfo
+from erkc63.parsers.parser import parse_accounts, parse_html_divclass, parse_token
+
+ACCOUNTS_HTML = """
+<html><head><meta name="csrf-token" content="token123"></head><body>
+<div class="dropdown dropdown-menu-right">
+  <a href="/account/300"> 300 </a>
+  <a href="/account/200">200</a>
+  <a href="/account/100">100</a>
+  <a href="/account/add">Добавить</a>
+  <a href="/logout">Выход</a>
+</div>
+</body></html>
+"""
+
+# Значения блоков `text-col-*` главной страницы по их индексам
+ACCOUNT_COLS = [
+    "Самара, ул. Ленина, д. 1",
+    "Иванов И.И.",
+    "+79001234567",
+    "user@example.com",
+    "Л/с",
+    "123456",
+    "Площадь",
+    "50,5",
+    "Зарегистрировано",
+    "-",
+    "Проживает",
+    "2",
+    "Право",
+    "Собственность",
+    "1 234,56",
+    "Долг",
+    "100,00",
+    "Начислено",
+    "1 134,56",
+    "Перерасчет",
+    "0,00",
+    "Оплачено",
+    "500,00",
+]
+
+
+def _account_html() -> str:
+    cols = [
+        f'<div class="row text-col-{i}">{x}</div>' for i, x in enumerate(ACCOUNT_COLS)
+    ]
+    # вложенный блок и пробел `&nbsp;` не должны сдвигать индексы и значения
+    cols[0] = (
+        '<div class="row text-col-0"><span>&nbsp;</span>'
+        f"{ACCOUNT_COLS[0]}"
+        '<div class="text-col-inner">Подсказка</div></div>'
+    )
+
+    return f"<html><body>{''.join(cols)}</body></html>"
+
+
+METERS_HTML = """
+<html><body><form id="sendCountersValues">
+<div class="block-sch">
+  <div class="block-sch-title"><span>Холодная вода</span></div>
+  <span>&nbsp;</span>
+  <span>Счетчик № 12345</span>
+  <span>01.02.25</span>
+  <span>12,5</span>
+  <input type="text" name="value[1]" value="">
+  <input type="hidden" name="rowId[1]" value="77">
+</div>
+<div class="block-sch">
+  <span>Горячая вода</span>
+  <span>Счетчик № 67890</span>
+  <span>01.02.25</span>
+  <span>3,25</span>
+  <input type="hidden" name="rowId[2]" value="78">
+</div>
+</form></body></html>
+"""
+
+
+class ParserTest(unittest.TestCase):
+    def test_parse_accounts(self):
+        self.assertEqual(parse_accounts(ACCOUNTS_HTML), (300, 100, 200))
+
+    def test_parse_token(self):
+        self.assertEqual(parse_token(ACCOUNTS_HTML), "token123")
+
+    def test_divclass_skips_nested(self):
+        self.assertEqual(len(parse_html_divclass(_account_html(), "text-col-")), 23)
+        self.assertEqual(len(parse_html_divclass(METERS_HTML, "block-sch")), 2)
+
+    def test_account_info(self):
+        info = AccountInfo.from_html(_account_html())
+
+        self.assertEqual(info.account, 123456)
+        self.assertEqual(info.address, "Самара, ул. Ленина, д. 1")
+        self.assertEqual(info.payment, Decimal("1234.56"))
+        self.assertEqual(info.debt, Decimal("100.00"))
+        self.assertEqual(info.accrued, Decimal("1134.56"))
+        self.assertEqual(info.recalculation, Decimal("0.00"))
+        self.assertEqual(info.paid, Decimal("500.00"))
+        self.assertEqual(info.owner, "Иванов И.И.")
+        self.assertEqual(info.total_area, Decimal("50.5"))
+        self.assertEqual(info.people_registered, 0)
+        self.assertEqual(info.people_lives, 2)
+        self.assertEqual(info.ownership, "Собственность")
+
+    def test_meters_info(self):
+        meters = MeterInfo.meters_from_html(METERS_HTML)
+
+        self.assertEqual(list(meters), [77, 78])
+        self.assertEqual(meters[77].name, "Холодная вода")
+        self.assertEqual(meters[77].serial, "12345")
+        self.assertEqual(meters[77].date, dt.date(2025, 2, 1))
+        self.assertEqual(meters[77].value, Decimal("12.5"))
+        self.assertEqual(meters[78].value, Decimal("3.25"))
+
+
+if __name__ == "__main__":
+    unittest.main()